@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 
 from standupbot.config import AppConfig, TriggerConfig
 
+try:
+    import ahocorasick
+except ModuleNotFoundError:  # optional: uv pip install -e ".[fast]"
+    ahocorasick = None
+
 
 @dataclass
 class TriggerMatch:
@@ -17,14 +25,34 @@ class TriggerMatch:
 class Analyzer:
     """Checks transcribed text for trigger keywords and generates responses via claude."""
 
+    # Each turn stays in the session's context, so relaunch periodically to keep
+    # per-call latency from creeping up over a long meeting.
+    MAX_SESSION_TURNS = 20
+    # A stuck turn (e.g. a hung MCP tool) must not hold the session lock forever.
+    TURN_TIMEOUT_SECONDS = 120
+    SHUTDOWN_TIMEOUT_SECONDS = 5
+    STDERR_TAIL_LINES = 50
+
     def __init__(self, config: AppConfig) -> None:
         self._triggers = config.triggers
         self._claude_model = config.claude.model
         self._user_context = config.user_context
         self._allowed_tools = config.claude.allowed_tools
         self._system_prompt = self._build_system_prompt(config)
-        self._last_fired: dict[str, float] = {}
-        self._transcript_history: list[str] = []
+        # Last fire time per trigger, indexed like self._triggers.
+        self._last_fired: list[float] = [0.0] * len(config.triggers)
+        # Keywords lowered once here so matching only lowers the utterance.
+        self._trigger_keywords: list[tuple[TriggerConfig, list[str]]] = [
+            (t, [k.lower() for k in t.keywords]) for t in config.triggers
+        ]
+        self._automaton = self._build_automaton(self._trigger_keywords)
+        # Keep last ~20 utterances for context
+        self._transcript_history: deque[str] = deque(maxlen=20)
+        self._proc: asyncio.subprocess.Process | None = None
+        self._proc_lock = asyncio.Lock()
+        self._session_turns = 0
+        self._stderr_tail: deque[str] = deque(maxlen=self.STDERR_TAIL_LINES)
+        self._stderr_task: asyncio.Task[None] | None = None
 
     @staticmethod
     def _build_system_prompt(config: AppConfig) -> str:
@@ -35,66 +63,213 @@ class Analyzer:
         """
         return config.user_context.strip() if config.user_context else ""
 
+    @staticmethod
+    def _build_automaton(
+        trigger_keywords: list[tuple[TriggerConfig, list[str]]],
+    ) -> object | None:
+        """Build an Aho-Corasick automaton over every trigger keyword.
+
+        Each lowered keyword maps to the (trigger index, keyword index, keyword)
+        entries that use it, so a single scan of the text finds all hits.
+        Returns None when pyahocorasick isn't installed.
+        """
+        if ahocorasick is None:
+            return None
+        entries: dict[str, list[tuple[int, int, str]]] = {}
+        for ti, (trigger, lowered) in enumerate(trigger_keywords):
+            for ki, (keyword, word) in enumerate(zip(trigger.keywords, lowered)):
+                entries.setdefault(word, []).append((ti, ki, keyword))
+        if not entries:
+            return None
+        automaton = ahocorasick.Automaton()
+        for word, value in entries.items():
+            automaton.add_word(word, value)
+        automaton.make_automaton()
+        return automaton
+
     def add_to_history(self, text: str) -> None:
         self._transcript_history.append(text)
-        # Keep last ~20 utterances for context
-        if len(self._transcript_history) > 20:
-            self._transcript_history = self._transcript_history[-20:]
 
-    def check_keywords(self, text: str) -> tuple[TriggerConfig, str] | None:
-        """Fast substring match against all triggers, respecting cooldowns."""
+    def find_match(self, text: str) -> tuple[int, TriggerConfig, str] | None:
+        """Fast substring match against all triggers, respecting cooldowns.
+
+        Returns (trigger index, trigger, keyword). Triggers are checked in
+        config order, and within a trigger the first listed keyword wins,
+        whether or not the automaton is available. Does not start the
+        cooldown; pass the index to commit_fire() once a response is underway.
+        """
         text_lower = text.lower()
         now = time.monotonic()
 
-        for trigger in self._triggers:
-            last = self._last_fired.get(trigger.name, 0.0)
-            if now - last < trigger.cooldown_seconds:
+        if self._automaton is not None:
+            best: tuple[int, int, str] | None = None
+            for _, entries in self._automaton.iter(text_lower):
+                for entry in entries:
+                    if best is not None and entry >= best:
+                        continue
+                    ti = entry[0]
+                    if now - self._last_fired[ti] >= self._triggers[ti].cooldown_seconds:
+                        best = entry
+            if best is None:
+                return None
+            ti, _, keyword = best
+            return ti, self._triggers[ti], keyword
+
+        for ti, (trigger, lowered) in enumerate(self._trigger_keywords):
+            if now - self._last_fired[ti] < trigger.cooldown_seconds:
                 continue
 
-            for keyword in trigger.keywords:
-                if keyword.lower() in text_lower:
-                    self._last_fired[trigger.name] = now
-                    return trigger, keyword
+            for keyword, word in zip(trigger.keywords, lowered):
+                if word in text_lower:
+                    return ti, trigger, keyword
 
         return None
 
-    async def generate_response(self, trigger: TriggerConfig, transcript: str) -> str:
-        """Call `claude -p` to generate a response."""
-        context = "\n".join(self._transcript_history[-10:])
-        prompt = (
-            f"Recent meeting transcript:\n{context}\n\n"
-            f"Latest utterance: {transcript}\n\n"
-            f"{trigger.prompt}"
-        )
+    def commit_fire(self, index: int) -> None:
+        """Start the cooldown for the trigger at index, which is about to respond."""
+        self._last_fired[index] = time.monotonic()
+
+    async def _ensure_proc(self) -> asyncio.subprocess.Process:
+        """Start a long-lived `claude` session if one isn't already running.
 
-        cmd = ["claude", "-p", prompt, "--model", self._claude_model]
+        The session reads user messages as stream-json on stdin and emits a
+        `result` event per turn, so model startup is paid once per session
+        rather than once per trigger. Sessions are recycled after
+        MAX_SESSION_TURNS turns.
+        """
+        if self._proc is not None and self._proc.returncode is None:
+            if self._session_turns < self.MAX_SESSION_TURNS:
+                return self._proc
+            await self._discard_proc()
+
+        cmd = [
+            "claude", "-p",
+            "--input-format", "stream-json",
+            "--output-format", "stream-json",
+            "--verbose",
+            "--model", self._claude_model,
+        ]
         if self._system_prompt:
             cmd.extend(["--append-system-prompt", self._system_prompt])
         if self._allowed_tools:
             cmd.extend(["--allowedTools", ",".join(self._allowed_tools)])
 
-        proc = await asyncio.create_subprocess_exec(
+        self._proc = await asyncio.create_subprocess_exec(
             *cmd,
+            stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=16 * 1024 * 1024,  # stream-json events can carry large tool output
+        )
+        self._session_turns = 0
+        # Drain stderr continuously so a chatty CLI or MCP server can't fill
+        # the pipe and block the session; keep only a tail for error reports.
+        self._stderr_tail = deque(maxlen=self.STDERR_TAIL_LINES)
+        assert self._proc.stderr is not None
+        self._stderr_task = asyncio.create_task(
+            self._drain_stderr(self._proc.stderr, self._stderr_tail)
+        )
+        return self._proc
+
+    @staticmethod
+    async def _drain_stderr(stream: asyncio.StreamReader, tail: deque[str]) -> None:
+        async for line in stream:
+            tail.append(line.decode(errors="replace").rstrip())
+
+    @staticmethod
+    async def _read_result(proc: asyncio.subprocess.Process) -> str:
+        """Read stream-json events until the turn's `result` event."""
+        assert proc.stdout is not None
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                raise EOFError
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get("type") != "result":
+                continue
+            if event.get("is_error") or event.get("subtype") != "success":
+                err = event.get("result") or event.get("subtype", "unknown error")
+                return f"[Claude error: {err}]"
+            return (event.get("result") or "").strip()
+
+    async def _discard_proc(self) -> str:
+        """Stop the session and return the tail of what it wrote to stderr.
+
+        Closing stdin lets the CLI exit on EOF and shut down its MCP servers;
+        it is only killed if that takes longer than SHUTDOWN_TIMEOUT_SECONDS.
+        """
+        proc, self._proc = self._proc, None
+        stderr_task, self._stderr_task = self._stderr_task, None
+        if proc is None:
+            return ""
+        if proc.returncode is None:
+            assert proc.stdin is not None
+            proc.stdin.close()
+            try:
+                async with asyncio.timeout(self.SHUTDOWN_TIMEOUT_SECONDS):
+                    await proc.wait()
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+        if stderr_task is not None:
+            # Ends at EOF, which can wait on MCP children still holding the pipe.
+            try:
+                async with asyncio.timeout(self.SHUTDOWN_TIMEOUT_SECONDS):
+                    await stderr_task
+            except TimeoutError:
+                stderr_task.cancel()
+        return "\n".join(self._stderr_tail).strip()
+
+    async def generate_response(self, trigger: TriggerConfig, transcript: str) -> str:
+        """Send a prompt to the persistent `claude` session and return its reply."""
+        history = self._transcript_history
+        context = "\n".join(islice(history, max(0, len(history) - 10), None))
+        prompt = (
+            f"Recent meeting transcript:\n{context}\n\n"
+            f"Latest utterance: {transcript}\n\n"
+            f"{trigger.prompt}"
         )
-        stdout, stderr = await proc.communicate()
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        payload = (json.dumps(message) + "\n").encode()
 
-        if proc.returncode != 0:
-            err = stderr.decode().strip()
-            return f"[Claude error: {err}]"
+        async with self._proc_lock:
+            err = ""
+            # One relaunch if the session died since the last call.
+            for _ in range(2):
+                proc = await self._ensure_proc()
+                assert proc.stdin is not None
+                try:
+                    async with asyncio.timeout(self.TURN_TIMEOUT_SECONDS):
+                        proc.stdin.write(payload)
+                        await proc.stdin.drain()
+                        response = await self._read_result(proc)
+                    self._session_turns += 1
+                    return response
+                except TimeoutError:
+                    # stdout may hold half a turn; start the next call fresh.
+                    await self._discard_proc()
+                    return "[Claude error: timed out]"
+                except (BrokenPipeError, ConnectionResetError, EOFError):
+                    err = await self._discard_proc()
+            return f"[Claude error: {err or 'claude exited unexpectedly'}]"
 
-        return stdout.decode().strip()
+    async def close(self) -> None:
+        """Shut down the `claude` session, if running."""
+        await self._discard_proc()
 
     async def analyze(self, text: str) -> TriggerMatch | None:
         """Check for triggers and generate a response if matched."""
         self.add_to_history(text)
 
-        match = self.check_keywords(text)
+        match = self.find_match(text)
         if match is None:
             return None
 
-        trigger, keyword = match
+        index, trigger, keyword = match
+        self.commit_fire(index)
         response = await self.generate_response(trigger, text)
         return TriggerMatch(trigger=trigger, matched_keyword=keyword, response=response)
 
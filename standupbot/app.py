@@ -11,7 +11,7 @@ from textual.widgets import Footer, Header, RichLog
 
 from standupbot.analyzer import Analyzer, TriggerMatch
 from standupbot.audio import AudioCapture
-from standupbot.config import load_config
+from standupbot.config import TriggerConfig, load_config
 from standupbot.speaker import KokoroSpeaker, SaySpeaker, create_speaker
 from standupbot.transcriber import Transcriber
 
@@ -60,10 +60,14 @@ class StandupBotApp(App):
         self._paused = asyncio.Event()  # clear = paused, set = running
         self._paused.set()
         self._speaking = asyncio.Event()
+        self._speak_lock = asyncio.Lock()
         self._capture: AudioCapture | None = None
         self._triggers_enabled = False
+        self._chrome_triggers_enabled: bool | None = None  # last state drawn by _update_chrome
         self._analyzer: Analyzer | None = None
         self._speaker: SaySpeaker | KokoroSpeaker | None = None
+        self._transcript_log: RichLog  # set in on_mount
+        self._responses_log: RichLog
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -77,18 +81,26 @@ class StandupBotApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        responses_log = self.query_one("#responses", RichLog)
+        # Cache panel widgets so per-utterance writes skip the selector query.
+        self._transcript_log = self.query_one("#transcript", RichLog)
+        self._responses_log = self.query_one("#responses", RichLog)
+        responses_log = self._responses_log
         responses_log.write("[bold]Available triggers:[/]")
         for i, trigger in enumerate(self._config.triggers):
             keywords = ", ".join(trigger.keywords)
             responses_log.write(f"  [bold]{i + 1}[/] {trigger.name} [dim]({keywords})[/]")
         responses_log.write("")
+
+        # Subtitle on responses panel: numbered trigger shortcuts (fixed after config load)
+        hints = "  ".join(f"{i + 1}={t.name}" for i, t in enumerate(self._config.triggers))
+        responses_log.border_subtitle = hints
+
         self._update_chrome()
         self._run_pipeline()
 
     @work(exclusive=True)
     async def _run_pipeline(self) -> None:
-        transcript_log = self.query_one("#transcript", RichLog)
+        transcript_log = self._transcript_log
 
         # Use pre-loaded transcriber (model loaded on main thread before TUI starts)
         assert self._transcriber is not None
@@ -130,33 +142,32 @@ class StandupBotApp(App):
 
                 transcript_log.write(f"[dim]{text}[/]")
 
-                # Check triggers (only if auto-triggers enabled)
-                if self._triggers_enabled:
-                    keyword_match = analyzer.check_keywords(text)
-                    if keyword_match:
-                        trigger, keyword = keyword_match
-                        responses_log = self.query_one("#responses", RichLog)
-                        responses_log.write(
-                            f"[bold yellow]Triggered:[/] [bold cyan]{trigger.name}[/] "
-                            f"[dim](matched: '{keyword}')[/]"
-                        )
-                        self.sub_title = f"Generating response for {trigger.name}..."
-                        analyzer.add_to_history(text)
-                        response = await analyzer.generate_response(trigger, text)
-                        result = TriggerMatch(trigger=trigger, matched_keyword=keyword, response=response)
-                    else:
-                        analyzer.add_to_history(text)
-                        result = None
-                else:
-                    analyzer.add_to_history(text)
-                    result = None
-
-                if result is not None:
-                    await self._handle_trigger_result(result)
+                analyzer.add_to_history(text)
+
+                # Check triggers (only if auto-triggers enabled). The response is
+                # generated in a worker so capture and transcription keep going.
+                keyword_match = analyzer.find_match(text) if self._triggers_enabled else None
+                if keyword_match:
+                    index, trigger, keyword = keyword_match
+                    analyzer.commit_fire(index)
+                    self._responses_log.write(
+                        f"[bold yellow]Triggered:[/] [bold cyan]{trigger.name}[/] "
+                        f"[dim](matched: '{keyword}')[/]"
+                    )
+                    self._respond_to_trigger(trigger, keyword, text)
                 else:
                     self._update_chrome()
         finally:
             self._capture.stop()
+            await analyzer.close()
+
+    @work(group="triggers")
+    async def _respond_to_trigger(self, trigger: TriggerConfig, keyword: str, text: str) -> None:
+        assert self._analyzer is not None
+        self.sub_title = f"Generating response for {trigger.name}..."
+        response = await self._analyzer.generate_response(trigger, text)
+        result = TriggerMatch(trigger=trigger, matched_keyword=keyword, response=response)
+        await self._handle_trigger_result(result)
 
     def _update_chrome(self) -> None:
         """Update header subtitle and responses panel border to reflect current state."""
@@ -167,21 +178,20 @@ class StandupBotApp(App):
             state = "Paused"
 
         trigger_label = "ON" if self._triggers_enabled else "OFF"
+        # Always assigned: "Transcribing..." etc. overwrite it between calls.
         self.sub_title = f"{state} | Auto-triggers: {trigger_label}"
 
-        # Responses panel border title
-        responses = self.query_one("#responses", RichLog)
+        # Responses panel border title, only when the trigger state changed
+        if self._triggers_enabled == self._chrome_triggers_enabled:
+            return
+        self._chrome_triggers_enabled = self._triggers_enabled
         if self._triggers_enabled:
-            responses.border_title = "Bot Responses [Triggers ON]"
+            self._responses_log.border_title = "Bot Responses [Triggers ON]"
         else:
-            responses.border_title = "Bot Responses [Triggers OFF]"
-
-        # Subtitle on responses panel: numbered trigger shortcuts
-        hints = "  ".join(f"{i + 1}={t.name}" for i, t in enumerate(self._config.triggers))
-        responses.border_subtitle = hints
+            self._responses_log.border_title = "Bot Responses [Triggers OFF]"
 
     async def _handle_trigger_result(self, result: TriggerMatch) -> None:
-        responses_log = self.query_one("#responses", RichLog)
+        responses_log = self._responses_log
         responses_log.write(
             f"[bold cyan]\\[{result.trigger.name}][/] "
             f"[dim](matched: '{result.matched_keyword}')[/]"
@@ -189,9 +199,10 @@ class StandupBotApp(App):
         responses_log.write(result.response)
         responses_log.write("")
 
-        self.sub_title = "Speaking..."
         assert self._speaker is not None
-        await self._speaker.speak(result.response)
+        async with self._speak_lock:  # one response on the call at a time
+            self.sub_title = "Speaking..."
+            await self._speaker.speak(result.response)
         self._update_chrome()
 
     def action_toggle_pause(self) -> None:
@@ -217,8 +228,8 @@ class StandupBotApp(App):
                 await self._handle_trigger_result(result)
 
     def action_clear_logs(self) -> None:
-        self.query_one("#transcript", RichLog).clear()
-        self.query_one("#responses", RichLog).clear()
+        self._transcript_log.clear()
+        self._responses_log.clear()
 
 
 def main() -> None:
@@ -249,6 +260,9 @@ def main() -> None:
         kokoro_pipeline = KPipeline(
             lang_code=config.tts.kokoro_lang_code, repo_id=config.tts.kokoro_repo_id
         )
+        # Also fetch the voice pack here (HF download + torch.load). KPipeline
+        # caches it, so KokoroSpeaker.load_model() inside the TUI is a lookup.
+        kokoro_pipeline.load_voice(config.tts.voice)
         print("Kokoro model loaded.")
 
     app = StandupBotApp(
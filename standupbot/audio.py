@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import queue
+import logging
+import threading
 from collections.abc import AsyncIterator
 
 import numpy as np
@@ -9,10 +10,16 @@ import sounddevice as sd
 
 from standupbot.config import AudioConfig, VADConfig
 
+log = logging.getLogger(__name__)
+
 
 class AudioCapture:
     """Captures audio from a PortAudio device and yields complete utterances."""
 
+    BLOCKSIZE = 1024
+    RING_SECONDS = 10  # how far the VAD task may lag behind the callback
+    SCRATCH_SECONDS = 30  # initial utterance buffer; grows for longer speech
+
     def __init__(
         self,
         audio_cfg: AudioConfig,
@@ -21,11 +28,27 @@ class AudioCapture:
     ) -> None:
         self._device = audio_cfg.capture_device
         self._sample_rate = audio_cfg.sample_rate
-        self._energy_threshold = vad_cfg.energy_threshold
+        self._energy_threshold_sq = vad_cfg.energy_threshold ** 2
         self._silence_duration = vad_cfg.silence_duration_s
+        self._min_speech_samples = int(vad_cfg.min_speech_s * audio_cfg.sample_rate)
+        self._min_speech_energy_sq = (
+            vad_cfg.min_speech_energy_ratio * vad_cfg.energy_threshold
+        ) ** 2
         self._speaking_event = speaking_event  # set while bot is speaking
-        self._queue: queue.Queue[np.ndarray] = queue.Queue()
         self._stream: sd.InputStream | None = None
+        # Preallocated blocks the callback copies into; the queue carries views.
+        ring_blocks = -(-self.RING_SECONDS * self._sample_rate // self.BLOCKSIZE)
+        self._ring = np.empty((ring_blocks, self.BLOCKSIZE), dtype=np.float32)
+        self._ring_head = 0
+        # Slots not yet handed back by the consumer. The callback drops a block
+        # rather than overwrite a slot whose view is still queued or in use.
+        self._ring_free = threading.Semaphore(ring_blocks)
+        self._dropped_blocks = 0
+        # Unbounded: _ring_free already caps how many blocks can be queued.
+        self._queue: asyncio.Queue[np.ndarray] = asyncio.Queue()
+        self._utterances: asyncio.Queue[np.ndarray] = asyncio.Queue()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._vad_task: asyncio.Task[None] | None = None
 
     def _audio_callback(
         self,
@@ -35,22 +58,35 @@ class AudioCapture:
         status: sd.CallbackFlags,
     ) -> None:
         """Called by PortAudio on its own thread."""
-        if self._speaking_event.is_set():
+        if self._speaking_event.is_set() or self._loop is None:
             return  # skip frames while bot is speaking
-        self._queue.put(indata.copy())
+        if not self._ring_free.acquire(blocking=False):
+            self._dropped_blocks += 1  # consumer is a full ring behind
+            return
+        # PortAudio reuses indata, so copy it into the next ring slot.
+        block = self._ring[self._ring_head, :frames]
+        np.copyto(block, indata[:, 0])
+        self._ring_head = (self._ring_head + 1) % len(self._ring)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, block)
 
     def start(self) -> None:
+        """Open the input stream and start VAD. Must be called from the event loop."""
+        self._loop = asyncio.get_running_loop()
         self._stream = sd.InputStream(
             device=self._device,
             samplerate=self._sample_rate,
             channels=1,
             dtype="float32",
-            blocksize=1024,
+            blocksize=self.BLOCKSIZE,
             callback=self._audio_callback,
         )
         self._stream.start()
+        self._vad_task = asyncio.create_task(self._run_vad())
 
     def stop(self) -> None:
+        if self._vad_task is not None:
+            self._vad_task.cancel()
+            self._vad_task = None
         if self._stream is not None:
             self._stream.stop()
             self._stream.close()
@@ -59,31 +95,91 @@ class AudioCapture:
     async def utterances(self) -> AsyncIterator[np.ndarray]:
         """Yields complete utterances as float32 numpy arrays.
 
-        Uses energy-based VAD: accumulates audio while energy is above threshold,
-        yields the accumulated buffer after silence_duration_s of quiet.
+        VAD runs in its own task from start(), so audio keeps being consumed
+        while the caller is transcribing or paused; utterances queue up here.
         """
-        loop = asyncio.get_running_loop()
-        buffer: list[np.ndarray] = []
+        vad_task = self._vad_task
+        assert vad_task is not None, "Call start() first"
+        while True:
+            next_utterance = asyncio.ensure_future(self._utterances.get())
+            await asyncio.wait(
+                {next_utterance, vad_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not next_utterance.done():
+                next_utterance.cancel()
+                vad_task.result()  # re-raise whatever stopped VAD
+                return
+            yield next_utterance.result()
+
+    async def _run_vad(self) -> None:
+        """Energy-based VAD feeding self._utterances.
+
+        Accumulates audio while energy is above threshold, and emits the
+        accumulated buffer after silence_duration_s of quiet. Utterances with
+        less than min_speech_s of speech, or whose speech is quieter on average
+        than min_speech_energy_ratio x the threshold, are dropped here so they
+        never reach whisper.
+        """
+        reported_drops = 0
+        scratch = self._new_scratch()
+        cursor = 0  # samples written to scratch for the current utterance
+        voiced_samples = 0
+        voiced_energy_sq = 0.0  # sum of squares over above-threshold chunks
         silence_samples = 0
         silence_threshold = int(self._silence_duration * self._sample_rate)
 
         while True:
-            try:
-                chunk = await loop.run_in_executor(None, self._queue.get, True, 0.1)
-            except queue.Empty:
-                continue
+            chunk = await self._queue.get()
+            if self._dropped_blocks != reported_drops:
+                log.warning(
+                    "Dropped %d audio blocks: capture ring was full",
+                    self._dropped_blocks - reported_drops,
+                )
+                reported_drops = self._dropped_blocks
+
+            # RMS >= threshold, without the sqrt or the squared temporary.
+            energy_sq = float(chunk @ chunk)
+            voiced = energy_sq >= self._energy_threshold_sq * len(chunk)
 
-            energy = float(np.sqrt(np.mean(chunk ** 2)))
+            # Chunks are ring views; copying them into scratch is their only
+            # copy. Trailing silence is kept too, for a natural cutoff.
+            n = len(chunk)
+            if voiced or cursor:
+                scratch = self._append(scratch, cursor, chunk)
+                cursor += n
+            self._ring_free.release()  # done with the view; the slot may be reused
 
-            if energy >= self._energy_threshold:
-                buffer.append(chunk)
+            if voiced:
+                voiced_samples += n
+                voiced_energy_sq += energy_sq
                 silence_samples = 0
-            elif buffer:
-                silence_samples += len(chunk)
-                buffer.append(chunk)  # include trailing silence for natural cutoff
+            elif cursor:
+                silence_samples += n
 
                 if silence_samples >= silence_threshold:
-                    utterance = np.concatenate(buffer).flatten()
-                    buffer.clear()
+                    is_speech = (
+                        voiced_samples >= self._min_speech_samples
+                        and voiced_energy_sq >= self._min_speech_energy_sq * voiced_samples
+                    )
+                    utterance = scratch[:cursor]
+                    cursor = 0
+                    voiced_samples = 0
+                    voiced_energy_sq = 0.0
                     silence_samples = 0
-                    yield utterance
+                    if is_speech:
+                        scratch = self._new_scratch()  # the queued view keeps the old one
+                        self._utterances.put_nowait(utterance)
+
+    def _new_scratch(self) -> np.ndarray:
+        return np.empty(self.SCRATCH_SECONDS * self._sample_rate, dtype=np.float32)
+
+    @staticmethod
+    def _append(scratch: np.ndarray, cursor: int, chunk: np.ndarray) -> np.ndarray:
+        """Copy chunk into scratch at cursor, growing scratch if it's full."""
+        end = cursor + len(chunk)
+        if end > len(scratch):
+            grown = np.empty(max(end, 2 * len(scratch)), dtype=np.float32)
+            grown[:cursor] = scratch[:cursor]
+            scratch = grown
+        scratch[cursor:end] = chunk
+        return scratch
@@ -5,6 +5,9 @@ from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class AudioConfig:
@@ -18,11 +21,15 @@ class AudioConfig:
 class VADConfig:
     energy_threshold: float = 0.01
     silence_duration_s: float = 1.5
+    min_speech_s: float = 0.4                 # drop utterances with less speech than this
+    min_speech_energy_ratio: float = 1.5      # ...or whose speech RMS is below ratio x threshold
 
 
 @dataclass
 class WhisperConfig:
     model_size: str = "base.en"
+    batch_size: int = 8                       # encoder batch for utterances over 30 s; 1 disables
+    cpu_threads: int = 0                      # CTranslate2 threads; 0 = one per CPU core
 
 
 @dataclass
@@ -64,7 +71,7 @@ def load_config(path: str | Path = "config.yaml") -> AppConfig:
     if not path.exists():
         return AppConfig()
 
-    raw = yaml.safe_load(path.read_text()) or {}
+    raw = yaml.load(path.read_text(), Loader=_YAML_LOADER) or {}
 
     config = AppConfig(
         audio=AudioConfig(**raw.get("audio", {})),
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import functools
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -10,6 +11,8 @@ import numpy as np
 from standupbot.config import AudioConfig, TTSConfig
 
 if TYPE_CHECKING:
+    import sounddevice as sd
+    import torch
     from kokoro import KPipeline
 
 log = logging.getLogger(__name__)
@@ -73,63 +76,109 @@ class KokoroSpeaker:
         self._local_device = audio_cfg.local_playback_device
         self._speaking_event = speaking_event
         self._pipeline = pipeline
+        self._voice_pack: torch.FloatTensor | None = None
 
     def load_model(self) -> None:
-        """Load the Kokoro pipeline if not already pre-loaded."""
-        if self._pipeline is not None:
-            return
-        try:
-            from kokoro import KPipeline
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "Kokoro TTS requires the 'kokoro' package. "
-                "Install it with: uv pip install -e \".[kokoro]\""
-            )
-        self._pipeline = KPipeline(lang_code=self._lang_code, repo_id=self._repo_id)
-
-    def _generate_audio(self, text: str) -> np.ndarray:
-        """Generate audio from text synchronously. Returns a numpy array."""
+        """Load the Kokoro pipeline if not already pre-loaded, then its voice pack."""
+        if self._pipeline is None:
+            try:
+                from kokoro import KPipeline
+            except ModuleNotFoundError:
+                raise ModuleNotFoundError(
+                    "Kokoro TTS requires the 'kokoro' package. "
+                    "Install it with: uv pip install -e \".[kokoro]\""
+                )
+            self._pipeline = KPipeline(lang_code=self._lang_code, repo_id=self._repo_id)
+        # Resolve the voice name to its embedding once rather than per synthesis.
+        # KPipeline caches voices, so this is cheap when main() already loaded it.
+        self._voice_pack = self._pipeline.load_voice(self._voice)
+
+    def _synthesize(self, text: str, emit: Callable[[np.ndarray | None], object]) -> None:
+        """Emit each synthesized chunk as it's generated, then None.
+
+        Runs on a worker thread; emit must be safe to call from it.
+        """
         assert self._pipeline is not None, "Call load_model() first"
-        chunks: list[np.ndarray] = []
-        for _, _, audio in self._pipeline(text, voice=self._voice):
-            if audio is not None:
-                chunks.append(audio)
-        if not chunks:
-            return np.array([], dtype=np.float32)
-        return np.concatenate(chunks)
+        try:
+            for _, _, audio in self._pipeline(text, voice=self._voice_pack):
+                if audio is None:
+                    continue
+                chunk = np.asarray(audio, dtype=np.float32)
+                chunk.flags.writeable = False  # one buffer shared by every device queue
+                emit(chunk)
+        finally:
+            emit(None)
 
     @staticmethod
-    def _play_on_device_sync(audio: np.ndarray, sample_rate: int, device: str) -> None:
-        """Play audio on a specific device. Each call gets its own OutputStream."""
+    def _open_stream(sample_rate: int, device: str) -> sd.OutputStream:
+        """Open and start a stereo OutputStream on a specific device."""
         import sounddevice as sd
 
-        stereo = np.column_stack([audio, audio])
-        with sd.OutputStream(samplerate=sample_rate, channels=2, device=device) as stream:
-            stream.write(stereo)
+        stream = sd.OutputStream(samplerate=sample_rate, channels=2, device=device)
+        stream.start()
+        return stream
+
+    async def _play_on_device(
+        self, chunks: asyncio.Queue[np.ndarray | None], device: str
+    ) -> None:
+        """Play queued audio chunks on a specific device until the None sentinel.
 
-    async def _play_on_device(self, audio: np.ndarray, device: str) -> None:
-        """Play audio array on a specific device using sounddevice."""
+        Only the blocking stream calls go to the executor; waiting for the next
+        chunk happens on the event loop.
+        """
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(
-            None, self._play_on_device_sync, audio, self.SAMPLE_RATE, device
+        # One stereo buffer per stream, grown as needed and filled in place.
+        stereo = np.empty((0, 2), dtype=np.float32)
+        stream = await loop.run_in_executor(
+            None, self._open_stream, self.SAMPLE_RATE, device
         )
+        try:
+            while (audio := await chunks.get()) is not None:
+                if len(audio) > len(stereo):
+                    stereo = np.empty((len(audio), 2), dtype=np.float32)
+                frame = stereo[: len(audio)]
+                frame[:] = audio[:, None]
+                await loop.run_in_executor(None, stream.write, frame)
+        finally:
+            await loop.run_in_executor(None, stream.stop)  # lets buffered audio finish
+            stream.close()
 
     async def speak(self, text: str) -> None:
-        """Generate audio, then play through configured devices.
+        """Stream audio to the configured devices as it's synthesized.
 
-        speaking_event is set only during playback, not during generation.
+        Playback starts once the first chunk is ready. speaking_event is set
+        from then until playback finishes, not while waiting for that chunk.
         """
         loop = asyncio.get_running_loop()
-        audio = await loop.run_in_executor(None, self._generate_audio, text)
-        if audio.size == 0:
+        devices = [self._device]
+        if self._local_device:
+            devices.append(self._local_device)
+        queues: list[asyncio.Queue[np.ndarray | None]] = [asyncio.Queue() for _ in devices]
+        first_chunk = asyncio.Event()
+
+        def fan_out(chunk: np.ndarray | None) -> None:
+            if chunk is not None:
+                first_chunk.set()
+            for q in queues:
+                q.put_nowait(chunk)
+
+        producer = loop.run_in_executor(
+            None,
+            self._synthesize,
+            text,
+            functools.partial(loop.call_soon_threadsafe, fan_out),
+        )
+        waiter = asyncio.ensure_future(first_chunk.wait())
+        await asyncio.wait({producer, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        if not first_chunk.is_set():
+            waiter.cancel()
+            await producer  # re-raise synthesis errors; otherwise there's no audio
             return
 
         self._speaking_event.set()
         try:
-            tasks = [self._play_on_device(audio, self._device)]
-            if self._local_device:
-                tasks.append(self._play_on_device(audio, self._local_device))
-            await asyncio.gather(*tasks)
+            tasks = [self._play_on_device(q, device) for q, device in zip(queues, devices)]
+            await asyncio.gather(producer, *tasks)
         finally:
             self._speaking_event.clear()
 
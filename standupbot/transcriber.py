@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from standupbot.config import WhisperConfig
 
@@ -12,19 +14,55 @@ from standupbot.config import WhisperConfig
 class Transcriber:
     """Wraps faster-whisper for async transcription."""
 
+    SAMPLE_RATE = 16000
+    # Whisper's window. The batched pipeline merges speech into chunks up to
+    # this long, so shorter utterances would be a single-item batch.
+    BATCH_MIN_SECONDS = 30
+
     def __init__(self, cfg: WhisperConfig) -> None:
         self._model_size = cfg.model_size
+        self._batch_size = cfg.batch_size
+        self._cpu_threads = cfg.cpu_threads or os.cpu_count() or 4
         self._model: WhisperModel | None = None
+        self._batched: BatchedInferencePipeline | None = None
+        # Dedicated decode thread so whisper never occupies the loop's default
+        # executor, which audio playback and Kokoro synthesis share.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
 
     def load_model(self) -> None:
-        self._model = WhisperModel(self._model_size, device="cpu", compute_type="int8")
+        self._model = WhisperModel(
+            self._model_size,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=self._cpu_threads,
+            num_workers=1,  # decodes are serialized on self._executor anyway
+        )
+        if self._batch_size > 1:
+            self._batched = BatchedInferencePipeline(model=self._model)
+        self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Run one decode on silence so the first real utterance isn't slowed by setup."""
+        assert self._model is not None
+        silence = np.zeros(self.SAMPLE_RATE, dtype=np.float32)  # 1 s
+        segments, _info = self._model.transcribe(silence, beam_size=1, language="en")
+        for _ in segments:  # transcribe is lazy; decoding happens on iteration
+            pass
 
     def _transcribe_sync(self, audio: np.ndarray) -> str:
         assert self._model is not None
-        segments, _info = self._model.transcribe(audio, beam_size=3, language="en")
+        if self._batched is not None and len(audio) > self.BATCH_MIN_SECONDS * self.SAMPLE_RATE:
+            # Splits long utterances on speech boundaries and encodes them in batches.
+            segments, _info = self._batched.transcribe(
+                audio, batch_size=self._batch_size, beam_size=3, language="en"
+            )
+        else:
+            segments, _info = self._model.transcribe(audio, beam_size=3, language="en")
         return " ".join(seg.text.strip() for seg in segments).strip()
 
     async def transcribe(self, audio: np.ndarray) -> str:
-        """Run whisper inference in a thread pool to avoid blocking the event loop."""
+        """Run whisper inference on its own thread to avoid blocking the event loop."""
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial(self._transcribe_sync, audio))
+        return await loop.run_in_executor(
+            self._executor, partial(self._transcribe_sync, audio)
+        )